@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Загрузка входных данных задачи распределения работ
+
+Поддерживаемые форматы:
+- data.txt в синтаксисе AMPL (set N, set T, param effort, param pref, скаляры)
+- CSV с колонками: task, effort, [name], <исполнитель_1>, <исполнитель_2>, ...
+  (значения в колонках исполнителей - предпочтения 0-10)
+- Parquet с теми же колонками (нужен pyarrow)
+
+Данные читаются потоково сразу в компактные массивы (array.array) без
+промежуточных словарей на каждую задачу. Разобранный результат кэшируется
+на диске по SHA-256 исходного файла - повторный запуск не парсит файл заново.
+"""
+
+import hashlib
+import os
+import pickle
+import csv
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# Версия формата кэша - увеличивать при изменении структуры AssignmentData
+# или правил разбора (2 - проверка задач по set T и полноты effort/pref)
+CACHE_VERSION = 2
+
+# Каталог кэша по умолчанию (рядом с этим модулем)
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+# Служебные колонки CSV/Parquet (все остальные - исполнители)
+TASK_COLUMN = "task"
+EFFORT_COLUMN = "effort"
+NAME_COLUMN = "name"
+
+
+class AssignmentData(NamedTuple):
+    """
+    Входные данные в компактном виде.
+
+    effort[i]            - трудоёмкость задачи tasks[i]
+    pref[i * W + k]      - предпочтение исполнителя workers[k] для задачи tasks[i],
+                           где W = len(workers) (матрица задачи × исполнители по строкам)
+    names                - названия задач (пустой список, если их нет во входе)
+    params               - скалярные параметры (alpha, beta, Lmin, ...)
+    """
+    workers: List[str]
+    tasks: List[str]
+    effort: array
+    pref: array
+    names: List[str]
+    params: Dict[str, float]
+
+    def pref_of(self, task_idx: int, worker_idx: int) -> float:
+        """Предпочтение исполнителя worker_idx для задачи task_idx"""
+        return self.pref[task_idx * len(self.workers) + worker_idx]
+
+    @classmethod
+    def from_mappings(cls, workers: List[str], effort: Dict[str, float],
+                      pref: Dict[str, List[float]], names: Optional[Dict[str, str]] = None,
+                      params: Optional[Dict[str, float]] = None) -> "AssignmentData":
+        """Сборка из словарей вида {задача: значение} (встроенные данные скрипта)"""
+        tasks = list(effort.keys())
+        flat_pref = array("d")
+        for t in tasks:
+            flat_pref.extend(pref[t])
+        return cls(
+            workers=list(workers),
+            tasks=tasks,
+            effort=array("d", (effort[t] for t in tasks)),
+            pref=flat_pref,
+            names=[names[t] for t in tasks] if names else [],
+            params=dict(params or {}),
+        )
+
+
+# =============================================================================
+# AMPL data.txt
+# =============================================================================
+
+def _iter_tokens(lines: Iterable[str]) -> Iterator[str]:
+    """Потоковое разбиение на токены: комментарии отбрасываются, ';' и ':=' - отдельные токены"""
+    for line in lines:
+        line = line.split("#", 1)[0]
+        if not line.strip():
+            continue
+        for tok in line.replace(":=", " := ").replace(";", " ; ").split():
+            yield tok
+
+
+def _expect(tokens: Iterator[str], expected: str) -> None:
+    tok = next(tokens, None)
+    if tok != expected:
+        raise ValueError(f"Ожидался '{expected}', получено '{tok}'")
+
+
+def _until(tokens: Iterator[str], stop: str) -> Iterator[str]:
+    """Токены до разделителя stop (сам разделитель поглощается)"""
+    for tok in tokens:
+        if tok == stop:
+            return
+        yield tok
+    raise ValueError(f"Неожиданный конец файла: не найден '{stop}'")
+
+
+def _number(tok: str, what: str) -> float:
+    try:
+        return float(tok)
+    except ValueError:
+        raise ValueError(f"{what}: ожидалось число, получено '{tok}'") from None
+
+
+def _take(values: Iterator[str], what: str) -> float:
+    """Следующее числовое значение строки (ValueError с описанием, если значений не хватает)"""
+    tok = next(values, None)
+    if tok is None:
+        raise ValueError(f"{what}: не хватает значений")
+    return _number(tok, what)
+
+
+def parse_ampl_data(path: str) -> AssignmentData:
+    """
+    Потоковый разбор data.txt.
+
+    Ожидаются множества N (исполнители) и T (задачи), одномерный параметр
+    effort и табличный параметр pref (строки - задачи, колонки - исполнители).
+    Прочие скалярные параметры попадают в params, прочие векторные - пропускаются.
+
+    Если множество T объявлено, задачи вне T в effort/pref - ошибка; без T задачи
+    регистрируются по мере появления. Для каждой задачи должны быть заданы
+    effort и предпочтения всех исполнителей.
+    """
+    workers: List[str] = []
+    tasks: List[str] = []
+    task_index: Dict[str, int] = {}
+    effort = array("d")
+    pref = array("d")
+    # Какие значения effort[i] и pref[i * W + k] заданы во входе
+    effort_set = bytearray()
+    pref_set = bytearray()
+    params: Dict[str, float] = {}
+    declared = False
+
+    def index_of(task: str) -> int:
+        idx = task_index.get(task)
+        if idx is None:
+            if declared:
+                raise ValueError(f"{path}: задача '{task}' не объявлена в set T")
+            idx = len(tasks)
+            task_index[task] = idx
+            tasks.append(task)
+            effort.append(0.0)
+            effort_set.append(0)
+            pref.extend([0.0] * len(workers))
+            pref_set.extend(bytes(len(workers)))
+        return idx
+
+    with open(path, encoding="utf-8") as f:
+        tokens = _iter_tokens(f)
+        for tok in tokens:
+            if tok == "set":
+                name = next(tokens)
+                _expect(tokens, ":=")
+                if name == "N":
+                    workers = list(_until(tokens, ";"))
+                elif name == "T":
+                    for t in _until(tokens, ";"):
+                        index_of(t)
+                    declared = True
+                else:
+                    for _ in _until(tokens, ";"):
+                        pass
+            elif tok == "param":
+                name = next(tokens)
+                table = name.endswith(":")
+                name = name.rstrip(":")
+                if not table:
+                    tok = next(tokens)
+                    if tok == ":":
+                        table = True
+                    elif tok != ":=":
+                        raise ValueError(f"param {name}: ожидался ':=' или ':', получено '{tok}'")
+
+                if table:
+                    columns = list(_until(tokens, ":="))
+                    if name != "pref":
+                        for _ in _until(tokens, ";"):
+                            pass
+                        continue
+                    if not workers:
+                        workers = columns
+                        pref = array("d", bytes(8 * len(tasks) * len(workers)))
+                        pref_set = bytearray(len(tasks) * len(workers))
+                    elif len(pref) != len(tasks) * len(workers):
+                        pref = array("d", bytes(8 * len(tasks) * len(workers)))
+                        pref_set = bytearray(len(tasks) * len(workers))
+                    w = len(workers)
+                    unknown = [c for c in columns if c not in workers]
+                    if unknown:
+                        raise ValueError(f"{path}: param pref: исполнители {unknown} не объявлены в set N")
+                    col_pos = [workers.index(c) for c in columns]
+                    row = _until(tokens, ";")
+                    for t in row:
+                        base = index_of(t) * w
+                        for k in col_pos:
+                            pref[base + k] = _take(row, f"{path}: param pref, задача '{t}'")
+                            pref_set[base + k] = 1
+                    continue
+
+                first = next(tokens)
+                second = next(tokens)
+                if second == ";":
+                    params[name] = _number(first, f"{path}: param {name}")
+                    continue
+                if name == "effort":
+                    rest = _until(tokens, ";")
+                    i = index_of(first)
+                    effort[i] = _number(second, f"{path}: param effort, задача '{first}'")
+                    effort_set[i] = 1
+                    for t in rest:
+                        i = index_of(t)
+                        effort[i] = _take(rest, f"{path}: param effort, задача '{t}'")
+                        effort_set[i] = 1
+                else:
+                    for _ in _until(tokens, ";"):
+                        pass
+            else:
+                raise ValueError(f"Неизвестная инструкция '{tok}'")
+
+    if not workers or not tasks:
+        raise ValueError(f"{path}: не заданы множества N и/или T")
+    if len(pref) != len(tasks) * len(workers):
+        raise ValueError(f"{path}: не задана матрица предпочтений pref")
+    w = len(workers)
+    for i, t in enumerate(tasks):
+        if not effort_set[i]:
+            raise ValueError(f"{path}: для задачи '{t}' не задан effort")
+        missing = [workers[k] for k in range(w) if not pref_set[i * w + k]]
+        if missing:
+            raise ValueError(f"{path}: для задачи '{t}' не заданы предпочтения: {', '.join(missing)}")
+
+    return AssignmentData(workers, tasks, effort, pref, [], params)
+
+
+# =============================================================================
+# Колоночные форматы (CSV / Parquet)
+# =============================================================================
+
+def _split_columns(header: List[str]):
+    """Позиции служебных колонок и список колонок исполнителей"""
+    if TASK_COLUMN not in header or EFFORT_COLUMN not in header:
+        raise ValueError(f"Требуются колонки '{TASK_COLUMN}' и '{EFFORT_COLUMN}', получено: {header}")
+    service = (TASK_COLUMN, EFFORT_COLUMN, NAME_COLUMN)
+    workers = [c for c in header if c not in service]
+    if not workers:
+        raise ValueError("Нет колонок исполнителей")
+    return workers
+
+
+def parse_roster_csv(path: str) -> AssignmentData:
+    """Потоковый разбор CSV: одна строка - одна задача"""
+    tasks: List[str] = []
+    names: List[str] = []
+    effort = array("d")
+    pref = array("d")
+
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = [h.strip() for h in next(reader)]
+        workers = _split_columns(header)
+        task_pos = header.index(TASK_COLUMN)
+        effort_pos = header.index(EFFORT_COLUMN)
+        name_pos = header.index(NAME_COLUMN) if NAME_COLUMN in header else None
+        worker_pos = [header.index(w) for w in workers]
+
+        for row in reader:
+            if not row:
+                continue
+            line_no = reader.line_num
+            if len(row) < len(header):
+                raise ValueError(f"{path}:{line_no}: число колонок {len(row)}, ожидается {len(header)}")
+            row_effort = _number(row[effort_pos], f"{path}:{line_no}: {EFFORT_COLUMN}")
+            row_pref = [_number(row[k], f"{path}:{line_no}: {w}") for k, w in zip(worker_pos, workers)]
+            tasks.append(row[task_pos])
+            effort.append(row_effort)
+            if name_pos is not None:
+                names.append(row[name_pos])
+            pref.extend(row_pref)
+
+    return AssignmentData(workers, tasks, effort, pref, names, {})
+
+
+def parse_roster_parquet(path: str) -> AssignmentData:
+    """Разбор Parquet по колонкам (требуется pyarrow)"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Для чтения Parquet установите pyarrow: pip install pyarrow") from e
+
+    table = pq.read_table(path)
+    workers = _split_columns(list(table.column_names))
+    tasks = table.column(TASK_COLUMN).to_pylist()
+    effort = array("d", table.column(EFFORT_COLUMN).to_pylist())
+    names = table.column(NAME_COLUMN).to_pylist() if NAME_COLUMN in table.column_names else []
+
+    # Колонки исполнителей перекладываются в построчную матрицу
+    w = len(workers)
+    pref = array("d", bytes(8 * len(tasks) * w))
+    for k, worker in enumerate(workers):
+        pref[k::w] = array("d", table.column(worker).to_pylist())
+
+    return AssignmentData(workers, [str(t) for t in tasks], effort, pref, names, {})
+
+
+PARSERS = {
+    ".txt": parse_ampl_data,
+    ".dat": parse_ampl_data,
+    ".csv": parse_roster_csv,
+    ".parquet": parse_roster_parquet,
+}
+
+
+# =============================================================================
+# Кэширование
+# =============================================================================
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 содержимого файла (читается блоками)"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def data_digest(data: AssignmentData) -> str:
+    """
+    SHA-256 разобранных входных данных (исполнители, задачи, effort, pref).
+    Не зависит от формата источника и порядка байтов платформы; есть и у встроенных данных.
+    """
+    h = hashlib.sha256()
+    for names in (data.workers, data.tasks):
+        h.update("\x1f".join(names).encode("utf-8"))
+        h.update(b"\x1e")
+    for values in (data.effort, data.pref):
+        values = array("d", values)
+        if sys.byteorder != "little":
+            values.byteswap()
+        h.update(values.tobytes())
+    return h.hexdigest()
+
+
+def load_assignment_data(path: str, cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> AssignmentData:
+    """
+    Загрузка входных данных с кэшированием.
+
+    Формат определяется по расширению файла. Если cache_dir = None, кэш не используется.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    parser = PARSERS.get(ext)
+    if parser is None:
+        raise ValueError(f"Неподдерживаемый формат '{ext}', ожидается одно из: {', '.join(PARSERS)}")
+
+    if cache_dir is None:
+        return parser(path)
+
+    # Ключ: содержимое файла + формат (одинаковые байты в .txt и .csv разбираются по-разному)
+    cache_path = os.path.join(cache_dir, f"{file_digest(path)}.{ext.lstrip('.')}.v{CACHE_VERSION}.pickle")
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                data = pickle.load(f)
+            if isinstance(data, AssignmentData):
+                return data
+        except Exception:  # noqa: BLE001 - любой сбой чтения кэша считается промахом
+            pass  # Повреждённый или несовместимый кэш - разбираем заново
+
+    data = parser(path)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+    return data
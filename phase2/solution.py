@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Извлечение решения задачи распределения работ и сохранение результатов
+
+Значения переменных x[n, t] считываются из модели один раз в массив owner
+(owner[i] - индекс исполнителя задачи tasks[i]), все метрики считаются по нему.
+
+Режимы сохранения:
+- full    - JSON с отступами, включая входные данные (как для отчёта)
+- compact - JSON без входных данных и без отступов
+- binary  - строка JSON-заголовка с метриками + сырой массив owner (int32);
+            в заголовке - список задач (owner[i] относится к tasks[i]), порядок
+            байтов массива и data_digest входных данных для проверки при чтении
+"""
+
+import json
+import os
+import sys
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from data_loader import AssignmentData, data_digest
+
+OUTPUT_MODES = ("full", "compact", "binary")
+
+# Ключи входных данных, которые не пишутся в compact/binary режимах
+INPUT_KEYS = ("effort", "pref", "wbs_tasks", "effort_estimates", "base_prefs")
+
+
+def as_number(v: float):
+    """Целые значения из массивов float возвращаются как int (16, а не 16.0 в JSON)"""
+    return int(v) if float(v).is_integer() else v
+
+
+def extract_owner(x_values: Dict[Tuple[str, str], float], data: AssignmentData) -> array:
+    """
+    Один проход по значениям x (например, model.x.extract_values()).
+    Возвращает owner: индекс исполнителя для каждой задачи (-1, если не назначена).
+    """
+    worker_indices = {w: i for i, w in enumerate(data.workers)}
+    task_indices = {t: i for i, t in enumerate(data.tasks)}
+    owner = array("i", [-1]) * len(data.tasks)
+    for (n, t), val in x_values.items():
+        if val is not None and val > 0.5:
+            owner[task_indices[t]] = worker_indices[n]
+    return owner
+
+
+def worker_statistics(owner: array, data: AssignmentData) -> Dict[str, dict]:
+    """Нагрузка, число задач и предпочтения по исполнителям - один проход по owner"""
+    w = len(data.workers)
+    loads = [0.0] * w
+    pref_sums = [0.0] * w
+    task_lists: List[List[str]] = [[] for _ in range(w)]
+    effort, pref, tasks = data.effort, data.pref, data.tasks
+
+    for i, k in enumerate(owner):
+        if k < 0:
+            continue
+        loads[k] += effort[i]
+        pref_sums[k] += pref[i * w + k]
+        task_lists[k].append(tasks[i])
+
+    stats = {}
+    for k, n in enumerate(data.workers):
+        count = len(task_lists[k])
+        stats[n] = {
+            "tasks": task_lists[k],
+            "load": as_number(loads[k]),
+            "avg_pref": round(pref_sums[k] / count, 2) if count else 0,
+            "total_pref": as_number(pref_sums[k]),
+            "count": count,
+        }
+    return stats
+
+
+def write_results(path: str, results_data: dict, owner: array, mode: str = "full",
+                  data: Optional[AssignmentData] = None) -> None:
+    """Сохранение результатов в выбранном режиме (для binary нужны входные данные data)"""
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"Неизвестный режим '{mode}', ожидается одно из: {', '.join(OUTPUT_MODES)}")
+    if mode == "binary" and data is None:
+        raise ValueError("Для режима binary нужны входные данные (data)")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    if mode == "full":
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results_data, f, ensure_ascii=False, indent=2)
+        return
+
+    # Без входных данных и без дублирования списков задач в worker_stats
+    header = {k: v for k, v in results_data.items() if k not in INPUT_KEYS}
+    header["worker_stats"] = {
+        n: {k: v for k, v in s.items() if k != "tasks"}
+        for n, s in results_data["worker_stats"].items()
+    }
+
+    if mode == "compact":
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(header, f, ensure_ascii=False, separators=(",", ":"))
+        return
+
+    # binary: назначения восстанавливаются по owner и списку задач из заголовка
+    header.pop("assignments", None)
+    header["tasks"] = data.tasks
+    header["data_digest"] = data_digest(data)
+    header["owner"] = {"typecode": owner.typecode, "itemsize": owner.itemsize, "length": len(owner),
+                       "byteorder": sys.byteorder}
+    with open(path, "wb") as f:
+        f.write(json.dumps(header, ensure_ascii=False).encode("utf-8"))
+        f.write(b"\n")
+        owner.tofile(f)
+
+
+def read_binary_results(path: str, data: Optional[AssignmentData] = None) -> Tuple[dict, array]:
+    """
+    Чтение результатов, сохранённых в режиме binary: (заголовок, owner).
+
+    owner[i] - индекс исполнителя (header["workers"]) для задачи header["tasks"][i].
+    Если переданы входные данные data, проверяется, что результаты получены именно по ним.
+    """
+    with open(path, "rb") as f:
+        header = json.loads(f.readline().decode("utf-8"))
+        meta = header["owner"]
+        owner = array(meta["typecode"])
+        if owner.itemsize != meta["itemsize"]:
+            raise ValueError(f"{path}: размер элемента owner {meta['itemsize']}, на этой платформе {owner.itemsize}")
+        owner.fromfile(f, meta["length"])
+    if meta["byteorder"] != sys.byteorder:
+        owner.byteswap()
+    if len(header["tasks"]) != len(owner):
+        raise ValueError(f"{path}: длина owner ({len(owner)}) не совпадает с числом задач ({len(header['tasks'])})")
+    if data is not None and header["data_digest"] != data_digest(data):
+        raise ValueError(f"{path}: результаты получены для других входных данных")
+    return header, owner
@@ -8,7 +8,26 @@
 """
 
 from pyomo.environ import *
-import json
+import argparse
+import os
+
+from data_loader import AssignmentData, DEFAULT_CACHE_DIR, load_assignment_data
+from solution import OUTPUT_MODES, as_number, extract_owner, worker_statistics, write_results
+
+parser = argparse.ArgumentParser(description="Распределение работ Фазы 3 (MILP)")
+parser.add_argument("--data", default=None,
+                    help="Внешние входные данные: data.txt (AMPL), CSV или Parquet. "
+                         "По умолчанию используются встроенные данные ниже")
+parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                    help="Каталог кэша разобранных входных данных")
+parser.add_argument("--no-cache", action="store_true",
+                    help="Не использовать кэш разобранных данных")
+parser.add_argument("--output", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "out", "optimization_results.json"),
+                    help="Файл для сохранения результатов (по умолчанию - phase2/out/, не под контролем версий)")
+parser.add_argument("--output-mode", choices=OUTPUT_MODES, default="full",
+                    help="full - JSON с входными данными, compact - JSON без входных данных, "
+                         "binary - заголовок + массив назначений (для больших запусков)")
+args = parser.parse_args()
 
 # ==============================================================================
 # ШАГ 1: WBS - Декомпозиция задач Фазы 3 на подзадачи
@@ -135,9 +154,27 @@ pref["ORG-02"] = [5, 8, 5]    # Оформление - Овсянников от
 
 # Исполнители
 workers = ["Путилин М.", "Овсянников А.", "Сапегин П."]
+
+# Источник данных: встроенные словари (шаги 1-3) или внешний файл
+if args.data:
+    data = load_assignment_data(args.data, cache_dir=None if args.no_cache else args.cache_dir)
+else:
+    data = AssignmentData.from_mappings(
+        workers, effort, pref,
+        names={t: info["name"] for t, info in wbs_tasks.items()},
+    )
+
+workers = data.workers
+tasks = data.tasks
 worker_indices = {w: i for i, w in enumerate(workers)}
+task_indices = {t: i for i, t in enumerate(tasks)}
+W = len(workers)
+
+
+def task_name(t):
+    """Название задачи (если есть во входных данных)"""
+    return data.names[task_indices[t]] if data.names else ""
 
-tasks = list(wbs_tasks.keys())
 
 # Создаём модель Pyomo
 model = ConcreteModel("TaskAssignment")
@@ -147,20 +184,20 @@ model.N = Set(initialize=workers, doc="Исполнители")
 model.T = Set(initialize=tasks, doc="Задачи")
 
 # Параметры
-model.effort = Param(model.T, initialize=effort, doc="Трудоёмкость задач (часы)")
-model.pref = Param(model.N, model.T, initialize=lambda m, n, t: pref[t][worker_indices[n]], doc="Предпочтения")
+model.effort = Param(model.T, initialize=lambda m, t: data.effort[task_indices[t]], doc="Трудоёмкость задач (часы)")
+model.pref = Param(model.N, model.T, initialize=lambda m, n, t: data.pref_of(task_indices[t], worker_indices[n]), doc="Предпочтения")
 
 # Переменные
 model.x = Var(model.N, model.T, domain=Binary, doc="Назначение задачи исполнителю")
 model.maxLoad = Var(domain=NonNegativeReals, doc="Максимальная нагрузка")
 
 # Границы для нормировки
-total_effort = sum(effort.values())
+total_effort = sum(data.effort)
 Lmin = total_effort / len(workers)  # Идеальная равная нагрузка
 Lmax = total_effort
-Pmin = min(min(v) for v in pref.values())
-Pmax = max(max(v) for v in pref.values())
-maxTotalPref = sum(max(pref[t]) for t in tasks)  # Верхняя граница суммарного предпочтения
+Pmin = min(data.pref)
+Pmax = max(data.pref)
+maxTotalPref = sum(max(data.pref[i * W:(i + 1) * W]) for i in range(len(tasks)))  # Верхняя граница суммарного предпочтения
 
 # Ограничения
 def assign_constraint(m, t):
@@ -182,8 +219,8 @@ model.MinTasksConstr = Constraint(model.N, rule=min_tasks_constraint)
 # Минимизируем maxLoad и максимизируем суммарное предпочтение
 # f1 = (maxLoad - Lmin) / (Lmax - Lmin)  [0..1] - хотим минимизировать
 # f2 = totalPref / maxTotalPref [0..1] - хотим максимизировать, значит минимизируем (1 - f2)
-alpha = 0.5  # вес для баланса нагрузки
-beta = 0.5   # вес для предпочтений
+alpha = data.params.get("alpha", 0.5)  # вес для баланса нагрузки
+beta = data.params.get("beta", 0.5)    # вес для предпочтений
 
 def objective_rule(m):
     f1 = (m.maxLoad - Lmin) / (Lmax - Lmin + 1e-6)
@@ -205,79 +242,66 @@ print("=" * 70)
 print("РЕЗУЛЬТАТЫ РЕШЕНИЯ ЗАДАЧИ РАСПРЕДЕЛЕНИЯ РАБОТ")
 print("=" * 70)
 
-# Назначения
-assignments = {}
-for n in model.N:
-    assignments[n] = []
-    for t in model.T:
-        if value(model.x[n, t]) > 0.5:
-            assignments[n].append(t)
+# Значения x считываются из решателя один раз: owner[i] - индекс исполнителя задачи tasks[i]
+owner = extract_owner(model.x.extract_values(), data)
+worker_stats = worker_statistics(owner, data)
+assignments = {n: worker_stats[n]["tasks"] for n in workers}
 
 # Метрики по исполнителям
 print("\n### Сводка по исполнителям ###\n")
-worker_stats = {}
-for n in model.N:
-    load_val = sum(effort[t] for t in assignments[n])
-    if assignments[n]:
-        avg_pref = sum(pref[t][worker_indices[n]] for t in assignments[n]) / len(assignments[n])
-        total_pref_n = sum(pref[t][worker_indices[n]] for t in assignments[n])
-    else:
-        avg_pref = 0
-        total_pref_n = 0
-    worker_stats[n] = {
-        "tasks": assignments[n],
-        "load": load_val,
-        "avg_pref": round(avg_pref, 2),
-        "total_pref": total_pref_n,
-        "count": len(assignments[n])
-    }
+for n in workers:
+    stats = worker_stats[n]
     print(f"{n}:")
-    print(f"  Задач: {len(assignments[n])}")
-    print(f"  Нагрузка: {load_val} часов")
-    print(f"  Среднее предпочтение: {avg_pref:.2f}")
-    print(f"  Суммарное предпочтение: {total_pref_n}")
+    print(f"  Задач: {stats['count']}")
+    print(f"  Нагрузка: {stats['load']:g} часов")
+    print(f"  Среднее предпочтение: {stats['avg_pref']:.2f}")
+    print(f"  Суммарное предпочтение: {stats['total_pref']:g}")
     print()
 
 print("\n### Детальное распределение ###\n")
 print(f"{'Задача':<12} {'Название':<50} {'Исполнитель':<16} {'Часы':>6} {'Пред.':>6}")
 print("-" * 95)
-for t in tasks:
-    for n in model.N:
-        if value(model.x[n, t]) > 0.5:
-            print(f"{t:<12} {wbs_tasks[t]['name']:<50} {n:<16} {effort[t]:>6} {pref[t][worker_indices[n]]:>6}")
-            break
+for i, t in enumerate(tasks):
+    k = owner[i]
+    if k >= 0:
+        print(f"{t:<12} {task_name(t):<50} {workers[k]:<16} {data.effort[i]:>6g} {data.pref[i * W + k]:>6g}")
 
 print("\n### Метрики оптимизации ###\n")
 print(f"Максимальная нагрузка: {value(model.maxLoad):.1f} часов")
-total_pref_all = sum(pref[t][worker_indices[n]] for n in model.N for t in tasks if value(model.x[n, t]) > 0.5)
-print(f"Суммарное предпочтение (всего): {total_pref_all}")
+total_pref_all = sum(stats["total_pref"] for stats in worker_stats.values())
+print(f"Суммарное предпочтение (всего): {total_pref_all:g}")
 print(f"Идеальная равная нагрузка (Lmin): {Lmin:.1f} часов")
-print(f"Общая трудоёмкость: {total_effort} часов")
+print(f"Общая трудоёмкость: {total_effort:g} часов")
 
 # Минимальное среднее предпочтение (для отчёта)
 min_avg_pref = min(worker_stats[n]["avg_pref"] for n in workers)
 print(f"Минимальное среднее предпочтение среди исполнителей: {min_avg_pref:.2f}")
 
-# Сохранение результатов для отчёта
+# Сохранение результатов для отчёта (порядок ключей - как в optimization_results.json)
 results_data = {
-    "assignments": {n: assignments[n] for n in model.N},
-    "worker_stats": {n: worker_stats[n] for n in workers},
-    "effort": effort,
-    "pref": pref,
-    "wbs_tasks": wbs_tasks,
-    "effort_estimates": effort_estimates,
-    "base_prefs": base_prefs,
+    "assignments": assignments,
+    "worker_stats": worker_stats,
+}
+if args.output_mode == "full":
+    # Входные данные пишутся только в полном режиме
+    results_data["effort"] = {t: as_number(v) for t, v in zip(tasks, data.effort)}
+    results_data["pref"] = {t: [as_number(v) for v in data.pref[i * W:(i + 1) * W]] for i, t in enumerate(tasks)}
+    if not args.data:
+        # Исходные данные отчёта (только для встроенного набора)
+        results_data["wbs_tasks"] = wbs_tasks
+        results_data["effort_estimates"] = effort_estimates
+        results_data["base_prefs"] = base_prefs
+results_data.update({
     "workers": workers,
     "maxLoad": value(model.maxLoad),
     "minAvgPref": min_avg_pref,
-    "totalPref": total_pref_all,
+    "totalPref": as_number(total_pref_all),
     "Lmin": Lmin,
-    "total_effort": total_effort,
+    "total_effort": as_number(total_effort),
     "alpha": alpha,
     "beta": beta,
-}
+})
 
-with open('/home/claude/work/optimization_results.json', 'w', encoding='utf-8') as f:
-    json.dump(results_data, f, ensure_ascii=False, indent=2)
+write_results(args.output, results_data, owner, mode=args.output_mode, data=data)
 
-print("\n✓ Результаты сохранены в optimization_results.json")
+print(f"\n✓ Результаты сохранены в {args.output} (режим: {args.output_mode})")
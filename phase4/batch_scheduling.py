@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Пакетный режим планирования (портфель проектов)
+
+Экземпляры RCPSP расписываются в пуле процессов, который создаётся один раз
+и остаётся "тёплым" между экземплярами (модули импортированы, декодер создан).
+Результаты выдаются построчно в JSONL по мере готовности.
+
+Источники экземпляров:
+- каталог с файлами *.json (один экземпляр на файл) или отдельные файлы
+- stdin в формате JSONL (один экземпляр на строку)
+- локальный сокет (--listen HOST:PORT или --unix PATH): JSONL-запросы,
+  ответы возвращаются в то же соединение
+
+Формат экземпляра (JSON):
+    {
+      "id": "project-1",                       # необязательно (по умолчанию - имя файла / номер строки)
+      "predecessors": [[], [0], ...],
+      "durations": [0, 2, ...],                # либо "labor_hours": [[PM, BE, FE], ...]
+      "renewable_demands": [[0, 0, 0], ...],   # не нужно при "labor_hours"
+      "renewable_capacities": [1, 1, 1],
+      "num_random": 5000,                      # необязательно
+      "time_budget": 2.0                       # необязательно, секунды
+    }
+
+Бюджет времени кооперативный: после истечения срока случайные решения
+больше не генерируются, возвращается лучшее найденное.
+
+Генератор случайных чисел инициализируется заново для каждого экземпляра
+из --seed и id экземпляра, поэтому результат не зависит от распределения по
+процессам пула. Нечитаемые файлы и строки с некорректным JSON дают строку
+{"id": ..., "error": ...} и не останавливают пакет.
+"""
+
+import argparse
+import json
+import os
+import random
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator, Optional, TextIO
+
+from utility import ActivityListSampler, ActivityListDecoder, successors_by_predecessors
+from project_data import SourceItem, instance_error, instance_rcpsp_data, iter_paths
+from heuristics import compute_critical_metrics, make_heuristics
+
+DEFAULT_NUM_RANDOM = 5000
+DEFAULT_TIME_BUDGET = 5.0
+
+# Декодер процесса-исполнителя (создаётся один раз в initializer)
+_decoder: Optional[ActivityListDecoder] = None
+
+
+# =============================================================================
+# РАСПИСАНИЕ ОДНОГО ЭКЗЕМПЛЯРА (выполняется в процессе пула)
+# =============================================================================
+
+def _init_worker() -> None:
+    """Прогрев процесса пула: декодер создаётся один раз на процесс"""
+    global _decoder
+    _decoder = ActivityListDecoder()
+
+
+def schedule_instance(instance: dict, default_budget: float = DEFAULT_TIME_BUDGET, seed: int = 42) -> dict:
+    """Эвристики + случайная выборка в пределах бюджета времени; лучший результат"""
+    started = time.perf_counter()
+    # Воспроизводимость: состояние генератора зависит только от seed и id экземпляра
+    random.seed(f"{seed}:{instance.get('id')}")
+    budget = float(instance.get("time_budget", default_budget))
+    deadline = started + budget
+
+    predecessors = instance["predecessors"]
+    durations, demands = instance_rcpsp_data(instance)
+    capacities = instance["renewable_capacities"]
+    num_random = int(instance.get("num_random", DEFAULT_NUM_RANDOM))
+
+    decoder = _decoder or ActivityListDecoder()
+    successors = successors_by_predecessors(predecessors)
+    metrics = compute_critical_metrics(durations, predecessors, successors)
+    heuristics = make_heuristics(durations, successors, demands, capacities, metrics)
+    sampler = ActivityListSampler(predecessors, successors)
+
+    best_makespan = None
+    best_start_times = None
+    best_method = None
+    evaluated = 0
+
+    def evaluate(name, activity_list):
+        nonlocal best_makespan, best_start_times, best_method, evaluated
+        start_times = decoder.decode(activity_list, durations, predecessors, demands, capacities)
+        makespan = max(start_times[j] + durations[j] for j in range(len(durations)))
+        evaluated += 1
+        if best_makespan is None or makespan < best_makespan:
+            best_makespan, best_start_times, best_method = makespan, start_times, name
+
+    timed_out = False
+    for name, rule, direction in heuristics:
+        if evaluated and time.perf_counter() >= deadline:
+            timed_out = True
+            break
+        if direction == "min":
+            evaluate(name, sampler.generate_by_min_rule(rule))
+        else:
+            evaluate(name, sampler.generate_by_max_rule(rule))
+
+    if not timed_out:
+        for _ in range(num_random):
+            if time.perf_counter() >= deadline:
+                timed_out = True
+                break
+            evaluate("RANDOM", sampler.generate_random())
+
+    return {
+        "id": instance.get("id"),
+        "makespan": best_makespan,
+        "method": best_method,
+        "start_times": best_start_times,
+        "critical_path": max(metrics.earliest_finish),
+        "evaluated": evaluated,
+        "timed_out": timed_out,
+        "elapsed": round(time.perf_counter() - started, 4),
+    }
+
+
+# =============================================================================
+# ИСТОЧНИКИ ЭКЗЕМПЛЯРОВ (файлы и каталоги - project_data.iter_paths)
+# =============================================================================
+
+def iter_jsonl(stream: TextIO) -> Iterator[SourceItem]:
+    """Экземпляры из потока JSONL (пустые строки пропускаются); ошибка разбора - в третьем элементе"""
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            instance = json.loads(line)
+        except ValueError as e:
+            yield str(line_no), None, f"{type(e).__name__}: {e}"
+            continue
+        yield str(line_no), instance, instance_error(instance)
+
+
+# =============================================================================
+# ПУЛ И ПОТОКОВАЯ ВЫДАЧА РЕЗУЛЬТАТОВ
+# =============================================================================
+
+class BatchScheduler:
+    """
+    Общий пул процессов; результаты пишутся в JSONL по мере завершения.
+    Число одновременно отправленных в пул экземпляров одного потока ограничено
+    (max_in_flight), чтобы бесконечный вход не накапливался в памяти.
+    """
+
+    def __init__(self, workers: Optional[int] = None, time_budget: float = DEFAULT_TIME_BUDGET, seed: int = 42,
+                 max_in_flight: Optional[int] = None):
+        self.time_budget = time_budget
+        self.seed = seed
+        self.max_in_flight = max_in_flight or 2 * (workers or os.cpu_count() or 1)
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+    @staticmethod
+    def _write(out: TextIO, lock: threading.Lock, result: dict) -> None:
+        with lock:
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+
+    def submit(self, instance: dict, out: TextIO, lock: threading.Lock, slots: threading.Semaphore) -> None:
+        """Отправка экземпляра в пул; слот освобождается после записи результата"""
+        future = self.pool.submit(schedule_instance, instance, self.time_budget, self.seed)
+
+        def write(f: Future):
+            try:
+                result = f.result()
+            except Exception as e:  # noqa: BLE001 - ошибка экземпляра не должна останавливать пакет
+                result = {"id": instance["id"], "error": f"{type(e).__name__}: {e}"}
+            try:
+                self._write(out, lock, result)
+            except OSError:
+                pass  # Получатель закрыл соединение - результат некуда отдать
+            finally:
+                slots.release()
+
+        future.add_done_callback(write)
+
+    def run(self, instances: Iterator[SourceItem], out: TextIO) -> int:
+        """Отправка экземпляров в пул и ожидание записи всех результатов; возвращает их число"""
+        lock = threading.Lock()
+        slots = threading.BoundedSemaphore(self.max_in_flight)
+        count = 0
+        try:
+            for default_id, instance, error in instances:
+                count += 1
+                if error is not None:
+                    self._write(out, lock, {"id": default_id, "error": error})
+                    continue
+                instance.setdefault("id", default_id)
+                slots.acquire()
+                try:
+                    self.submit(instance, out, lock, slots)
+                except Exception:
+                    slots.release()
+                    raise
+        finally:
+            # Дожидаемся записи всех уже отправленных экземпляров
+            for _ in range(self.max_in_flight):
+                slots.acquire()
+        return count
+
+    def shutdown(self) -> None:
+        self.pool.shutdown()
+
+
+def serve(scheduler: BatchScheduler, address) -> None:
+    """Сервер JSONL на локальном сокете: соединение - поток запросов и ответов"""
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            reader = (line.decode("utf-8") for line in self.rfile)
+            scheduler.run(iter_jsonl(reader), _SocketWriter(self.wfile))
+
+    if isinstance(address, tuple):
+        server_cls = socketserver.ThreadingTCPServer
+    else:
+        server_cls = socketserver.ThreadingUnixStreamServer
+        if os.path.exists(address):
+            os.unlink(address)
+    server_cls.daemon_threads = True
+
+    with server_cls(address, Handler) as server:
+        print(f"Ожидание запросов на {address}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+class _SocketWriter:
+    """Текстовая обёртка над wfile соединения"""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, text: str) -> None:
+        self.wfile.write(text.encode("utf-8"))
+
+    def flush(self) -> None:
+        self.wfile.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетное планирование RCPSP (портфель проектов)")
+    parser.add_argument("paths", nargs="*",
+                        help="Файлы или каталоги с экземплярами *.json; без аргументов - JSONL из stdin")
+    parser.add_argument("--listen", default=None, help="Сервер на TCP-сокете HOST:PORT")
+    parser.add_argument("--unix", default=None, help="Сервер на Unix-сокете PATH")
+    parser.add_argument("--workers", type=int, default=None, help="Число процессов пула (по умолчанию - число CPU)")
+    parser.add_argument("--time-budget", type=float, default=DEFAULT_TIME_BUDGET,
+                        help="Бюджет времени на экземпляр по умолчанию, секунды")
+    parser.add_argument("--seed", type=int, default=42, help="Seed генераторов случайных чисел")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="Максимум экземпляров в пуле на один поток ввода (по умолчанию - 2 x число процессов)")
+    args = parser.parse_args()
+
+    scheduler = BatchScheduler(args.workers, args.time_budget, args.seed, args.max_in_flight)
+    try:
+        if args.listen:
+            host, port = args.listen.rsplit(":", 1)
+            serve(scheduler, (host, int(port)))
+        elif args.unix:
+            serve(scheduler, args.unix)
+        elif args.paths:
+            scheduler.run(iter_paths(args.paths), sys.stdout)
+        else:
+            scheduler.run(iter_jsonl(sys.stdin), sys.stdout)
+    finally:
+        scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    main()
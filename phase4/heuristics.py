@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Критические времена и приоритетные правила (эвристики) для RCPSP
+
+Метрики и правила строятся по данным конкретного экземпляра задачи,
+поэтому одни и те же эвристики применимы к любому проекту.
+"""
+
+from typing import Callable, List, NamedTuple, Tuple
+from utility import calculate_critical_times
+
+
+class CriticalMetrics(NamedTuple):
+    """Критические времена и резервы задач"""
+    earliest_start: List[int]
+    latest_finish: List[int]
+    latest_start: List[int]
+    earliest_finish: List[int]
+    total_slack: List[int]
+    free_slack: List[int]
+
+
+def compute_critical_metrics(durations: List[int], predecessors: List[List[int]],
+                             successors: List[List[int]]) -> CriticalMetrics:
+    """Расчёт ES, LF, LS, EF и резервов по сетевому графику"""
+    earliest_start, latest_finish = calculate_critical_times(durations, predecessors, successors)
+    n = len(durations)
+
+    # Поздние времена начала: LSTi = min(LSTj - di для j в successors[i])
+    latest_start = [0] * n
+    for i in range(n-1, -1, -1):
+        if i == n-1:
+            latest_start[i] = earliest_start[i]
+        elif successors[i]:
+            latest_start[i] = min(latest_start[j] for j in successors[i]) - durations[i]
+        else:
+            latest_start[i] = earliest_start[i]
+
+    # Общий резерв (Total Slack)
+    total_slack = [latest_start[i] - earliest_start[i] for i in range(n)]
+
+    # Ранние времена окончания
+    earliest_finish = [earliest_start[i] + durations[i] for i in range(n)]
+
+    # Свободный резерв (Free Slack)
+    free_slack = [0] * n
+    for i in range(n):
+        if successors[i]:
+            free_slack[i] = min(earliest_start[j] for j in successors[i]) - earliest_finish[i]
+        else:
+            free_slack[i] = 0
+
+    return CriticalMetrics(earliest_start, latest_finish, latest_start, earliest_finish, total_slack, free_slack)
+
+
+def make_heuristics(durations: List[int], successors: List[List[int]],
+                    renewable_demands: List[List[int]], renewable_capacities: List[int],
+                    metrics: CriticalMetrics) -> List[Tuple[str, Callable[[int], float], str]]:
+    """
+    Список эвристик (название, правило, направление) для экземпляра задачи.
+    Направление "min" - по возрастанию значения правила, "max" - по убыванию.
+    """
+    total_slack = metrics.total_slack
+    free_slack = metrics.free_slack
+    latest_start = metrics.latest_start
+    latest_finish = metrics.latest_finish
+
+    # Суммарные затраты ресурсов
+    total_demands = [sum(d) for d in renewable_demands]
+
+    def make_slk_rule():
+        """SLK - по возрастанию общего резерва"""
+        return lambda j: total_slack[j]
+
+    def make_free_rule():
+        """FREE - по возрастанию свободного резерва"""
+        return lambda j: free_slack[j]
+
+    def make_lst_rule():
+        """LST - по возрастанию позднего времени начала"""
+        return lambda j: latest_start[j]
+
+    def make_lft_rule():
+        """LFT - по возрастанию позднего времени завершения"""
+        return lambda j: latest_finish[j]
+
+    def make_lstlft_rule():
+        """LSTLFT - по возрастанию суммы LS + LF"""
+        return lambda j: latest_start[j] + latest_finish[j]
+
+    def make_grpw_rule():
+        """GRPW - по убыванию суммарной длительности задачи и её прямых последователей"""
+        def rule(j):
+            succ_duration = sum(durations[s] for s in successors[j])
+            return durations[j] + succ_duration
+        return rule
+
+    def make_lpt_rule():
+        """LPT - по убыванию длительности"""
+        return lambda j: durations[j]
+
+    def make_mis_rule():
+        """MIS - по убыванию числа прямых последователей"""
+        return lambda j: len(successors[j])
+
+    def make_grd_rule():
+        """GRD - по убыванию произведения длительности и суммарных затрат ресурсов"""
+        return lambda j: durations[j] * total_demands[j]
+
+    def make_grwc_rule():
+        """GRWC - по убыванию суммарных затрат ресурсов"""
+        return lambda j: total_demands[j]
+
+    def make_gcrwc_rule():
+        """GCRWC - по убыванию суммарных затрат ресурсов задачи и её прямых последователей"""
+        def rule(j):
+            succ_demands = sum(total_demands[s] for s in successors[j])
+            return total_demands[j] + succ_demands
+        return rule
+
+    def make_rot_rule():
+        """ROT - по убыванию суммы отношений затрат ресурсов к запасам, делённой на длительность"""
+        def rule(j):
+            if durations[j] == 0:
+                return 0
+            ratio_sum = sum(
+                renewable_demands[j][k] / renewable_capacities[k] if renewable_capacities[k] > 0 else 0
+                for k in range(len(renewable_capacities))
+            )
+            return ratio_sum / durations[j]
+        return rule
+
+    return [
+        ("SLK", make_slk_rule(), "min"),
+        ("FREE", make_free_rule(), "min"),
+        ("LST", make_lst_rule(), "min"),
+        ("LFT", make_lft_rule(), "min"),
+        ("LSTLFT", make_lstlft_rule(), "min"),
+        ("GRPW", make_grpw_rule(), "max"),
+        ("LPT", make_lpt_rule(), "max"),
+        ("MIS", make_mis_rule(), "max"),
+        ("GRD", make_grd_rule(), "max"),
+        ("GRWC", make_grwc_rule(), "max"),
+        ("GCRWC", make_gcrwc_rule(), "max"),
+        ("ROT", make_rot_rule(), "max"),
+    ]
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Совместное распределение работ (Фаза 3) и планирование (Фаза 5)
+Проект: Мобильная игра "Цифровой кузнечик"
+
+Вместо обезличенных ролей PM/BE/FE (renewable_capacities = [1, 1, 1])
+ресурсами RCPSP становятся конкретные исполнители:
+- пакет работ = (задача, роль) с ненулевыми трудозатратами из LABOR_HOURS
+- назначение пакетов исполнителям - задача распределения работ Фазы 3
+- исполнитель - возобновимый ресурс с доступностью 1
+- длительность задачи = max(часов одного исполнителя в задаче) / 8 дней
+  (один человек на двух ролях одной задачи выполняет их последовательно)
+
+Целевая функция назначения дополняется сроком проекта:
+    alpha * f1 (баланс нагрузки) + beta * f2 (предпочтения) + gamma * f3 (makespan)
+Назначение улучшается локальным поиском (перенос пакета к другому исполнителю),
+пока целевая функция уменьшается. Расписания кэшируются по паре
+(длительности, состав исполнителей задач) и переиспользуются между итерациями.
+
+Предпочтения исполнителей по ролям в отчёте отсутствуют: их нужно передать
+файлом --prefs, иначе используется одинаковое значение-заглушка для всех.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from utility import ActivityListSampler, ActivityListDecoder, successors_by_predecessors, calculate_critical_times
+from project_data import TASK_NAMES, ROLES, LABOR_HOURS, predecessors
+from heuristics import compute_critical_metrics, make_heuristics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "phase2"))
+from data_loader import AssignmentData, DEFAULT_CACHE_DIR, load_assignment_data  # noqa: E402
+from solution import worker_statistics  # noqa: E402
+
+# =============================================================================
+# ВХОДНЫЕ ДАННЫЕ
+# =============================================================================
+
+HOURS_PER_DAY = 8
+
+# Команда берётся из данных Фазы 3 (множество N в phase2/data.txt)
+PHASE2_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "phase2", "data.txt")
+
+
+def display_name(identifier: str) -> str:
+    """
+    Имя исполнителя как в результатах Фазы 3 по идентификатору AMPL:
+    "Путилин_М" -> "Путилин М." (имена без '_' возвращаются без изменений)
+    """
+    surname, *initials = identifier.split("_")
+    if not initials:
+        return identifier
+    return f"{surname} {''.join(i if i.endswith('.') else i + '.' for i in initials)}"
+
+# ЗАГЛУШКА: в отчёте нет предпочтений исполнителей по ролям PM/BE/FE.
+# Без --prefs всем ставится одинаковое нейтральное значение, и план определяется
+# только балансом нагрузки и сроком проекта
+PLACEHOLDER_PREF = 5
+
+
+class WorkPackages(NamedTuple):
+    """Пакеты работ в формате задачи распределения + привязка к задачам RCPSP"""
+    data: AssignmentData      # tasks - идентификаторы пакетов "j.ROLE", effort - часы
+    activity: array           # activity[i] - номер задачи RCPSP для пакета i
+    role: array               # role[i] - индекс роли для пакета i
+
+
+def build_work_packages(labor_hours: List[List[int]], workers: List[str],
+                        prefs: Optional[AssignmentData] = None,
+                        task_names: Optional[List[str]] = None) -> WorkPackages:
+    """
+    Формирование пакетов работ из трудозатрат по ролям.
+
+    prefs - внешние предпочтения (формат data_loader): строка с идентификатором
+    пакета имеет приоритет над строкой роли. Трудоёмкость из prefs не используется.
+    Без prefs всем исполнителям ставится PLACEHOLDER_PREF (предпочтения не влияют на план).
+    task_names - названия задач RCPSP (по умолчанию - номера задач).
+    Идентификаторы исполнителей AMPL переводятся в имена Фазы 3 (display_name).
+    """
+    if prefs is not None:
+        workers = prefs.workers
+        row_of = {t: i for i, t in enumerate(prefs.tasks)}
+    else:
+        row_of = {}
+    w = len(workers)
+
+    tasks: List[str] = []
+    effort = array("d")
+    pref = array("d")
+    activity = array("i")
+    role = array("i")
+
+    for j, hours in enumerate(labor_hours):
+        for r, h in enumerate(hours):
+            if h <= 0:
+                continue
+            package = f"{j}.{ROLES[r]}"
+            tasks.append(package)
+            effort.append(h)
+            activity.append(j)
+            role.append(r)
+            if prefs is None:
+                pref.extend([PLACEHOLDER_PREF] * w)
+                continue
+            row = row_of.get(package, row_of.get(ROLES[r]))
+            if row is None:
+                raise ValueError(f"Нет предпочтений для пакета {package} (ни по пакету, ни по роли {ROLES[r]})")
+            pref.extend(prefs.pref[row * w:(row + 1) * w])
+
+    names = [f"{task_names[j] if task_names else j} [{ROLES[r]}]" for j, r in zip(activity, role)]
+    data = AssignmentData([display_name(n) for n in workers], tasks, effort, pref, names, {})
+    return WorkPackages(data, activity, role)
+
+
+# =============================================================================
+# ОЦЕНКА РАСПИСАНИЯ ДЛЯ НАЗНАЧЕНИЯ
+# =============================================================================
+
+class ScheduleResult(NamedTuple):
+    makespan: int
+    start_times: List[int]
+    durations: List[int]
+    demands: List[List[int]]
+    method: str
+
+
+class ScheduleEvaluator:
+    """
+    RCPSP с исполнителями в качестве ресурсов.
+
+    Случайные Activity List не зависят от назначения и генерируются один раз -
+    все назначения сравниваются на одной выборке. Результаты кэшируются.
+    """
+
+    def __init__(self, packages: WorkPackages, predecessors: List[List[int]],
+                 num_random: int = 50, hours_per_day: int = HOURS_PER_DAY, seed: int = 42):
+        self.packages = packages
+        self.predecessors = predecessors
+        self.successors = successors_by_predecessors(predecessors)
+        self.hours_per_day = hours_per_day
+        self.num_activities = len(predecessors)
+        self.num_workers = len(packages.data.workers)
+        self.capacities = [1] * self.num_workers
+
+        self.sampler = ActivityListSampler(predecessors, self.successors)
+        self.decoder = ActivityListDecoder()
+        random.seed(seed)
+        self.random_lists = [self.sampler.generate_random() for _ in range(num_random)]
+
+        self.cache: Dict[Tuple[Tuple[int, ...], Tuple[int, ...]], ScheduleResult] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def instance(self, owner: array) -> Tuple[List[int], List[int]]:
+        """Длительности задач и маски задействованных исполнителей для назначения"""
+        n, w = self.num_activities, self.num_workers
+        hours = [0.0] * (n * w)
+        for i, k in enumerate(owner):
+            hours[self.packages.activity[i] * w + k] += self.packages.data.effort[i]
+
+        hpd = self.hours_per_day
+        durations = [0] * n
+        masks = [0] * n
+        for j in range(n):
+            row = hours[j * w:(j + 1) * w]
+            max_hours = max(row)
+            if max_hours > 0:
+                durations[j] = max(1, -int(-max_hours // hpd))
+            masks[j] = sum(1 << k for k, h in enumerate(row) if h > 0)
+        return durations, masks
+
+    def lower_bound(self, durations: List[int]) -> int:
+        """Длина критического пути без учёта ресурсов (нижняя граница makespan)"""
+        es, _ = calculate_critical_times(durations, self.predecessors, self.successors)
+        return max(es[j] + durations[j] for j in range(len(durations)))
+
+    def evaluate(self, owner: array) -> ScheduleResult:
+        durations, masks = self.instance(owner)
+        key = (tuple(durations), tuple(masks))
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        w = self.num_workers
+        demands = [[(m >> k) & 1 for k in range(w)] for m in masks]
+        metrics = compute_critical_metrics(durations, self.predecessors, self.successors)
+        heuristics = make_heuristics(durations, self.successors, demands, self.capacities, metrics)
+
+        candidates = []
+        for name, rule, direction in heuristics:
+            if direction == "min":
+                candidates.append((name, self.sampler.generate_by_min_rule(rule)))
+            else:
+                candidates.append((name, self.sampler.generate_by_max_rule(rule)))
+        candidates.extend(("RANDOM", al) for al in self.random_lists)
+
+        best = None
+        for name, activity_list in candidates:
+            start_times = self.decoder.decode(activity_list, durations, self.predecessors, demands, self.capacities)
+            makespan = max(start_times[j] + durations[j] for j in range(len(durations)))
+            if best is None or makespan < best.makespan:
+                best = ScheduleResult(makespan, start_times, durations, demands, name)
+
+        self.cache[key] = best
+        return best
+
+
+# =============================================================================
+# СОВМЕСТНАЯ ЦЕЛЕВАЯ ФУНКЦИЯ И ЛОКАЛЬНЫЙ ПОИСК
+# =============================================================================
+
+class JointState(NamedTuple):
+    objective: float
+    max_load: float
+    total_pref: float
+    makespan: int
+
+
+class JointPlanner:
+    """Итеративное совместное улучшение назначения и расписания"""
+
+    def __init__(self, packages: WorkPackages, evaluator: ScheduleEvaluator,
+                 alpha: float = 0.3, beta: float = 0.3, gamma: float = 0.4):
+        self.packages = packages
+        self.evaluator = evaluator
+        self.alpha, self.beta, self.gamma = alpha, beta, gamma
+
+        data = packages.data
+        w = len(data.workers)
+        # Границы для нормировки (как в Фазе 3) + границы срока проекта
+        self.total_effort = sum(data.effort)
+        self.Lmin = self.total_effort / w
+        self.Lmax = self.total_effort
+        self.maxTotalPref = sum(max(data.pref[i * w:(i + 1) * w]) for i in range(len(data.tasks)))
+
+        # Границы срока по самим пакетам: лучший случай - каждый пакет у своего
+        # исполнителя (длительность = самый длинный пакет задачи), худший - все
+        # пакеты задачи у одного исполнителя и задачи выполняются последовательно
+        hpd = evaluator.hours_per_day
+        n = evaluator.num_activities
+        max_package = [0.0] * n
+        sum_packages = [0.0] * n
+        for i, j in enumerate(packages.activity):
+            h = data.effort[i]
+            sum_packages[j] += h
+            if h > max_package[j]:
+                max_package[j] = h
+        best_durations = [max(1, -int(-h // hpd)) if h > 0 else 0 for h in max_package]
+        self.Mmin = evaluator.lower_bound(best_durations)
+        self.Mmax = sum(max(1, -int(-h // hpd)) if h > 0 else 0 for h in sum_packages)
+
+    def objective(self, max_load: float, total_pref: float, makespan: float) -> float:
+        f1 = (max_load - self.Lmin) / (self.Lmax - self.Lmin + 1e-6)
+        f2 = 1 - total_pref / (self.maxTotalPref + 1e-6)
+        f3 = (makespan - self.Mmin) / (self.Mmax - self.Mmin + 1e-6)
+        return self.alpha * f1 + self.beta * f2 + self.gamma * f3
+
+    def initial_assignment(self) -> array:
+        """
+        Начальное назначение - каждому пакету исполнитель с максимальным предпочтением,
+        при равных предпочтениях - наименее загруженный
+        """
+        data = self.packages.data
+        w = len(data.workers)
+        owner = array("i", [0]) * len(data.tasks)
+        loads = [0.0] * w
+        for i in range(len(data.tasks)):
+            row = data.pref[i * w:(i + 1) * w]
+            k = max(range(w), key=lambda k: (row[k], -loads[k], -k))
+            owner[i] = k
+            loads[k] += data.effort[i]
+        return owner
+
+    def state(self, owner: array) -> JointState:
+        data = self.packages.data
+        w = len(data.workers)
+        loads = [0.0] * w
+        total_pref = 0.0
+        for i, k in enumerate(owner):
+            loads[k] += data.effort[i]
+            total_pref += data.pref[i * w + k]
+        makespan = self.evaluator.evaluate(owner).makespan
+        return JointState(self.objective(max(loads), total_pref, makespan), max(loads), total_pref, makespan)
+
+    def improve(self, owner: array) -> Optional[Tuple[int, int, JointState]]:
+        """
+        Лучший перенос одного пакета к другому исполнителю.
+        Кандидаты отсекаются по нижней границе makespan (критический путь без ресурсов)
+        до построения расписания.
+        """
+        data = self.packages.data
+        w = len(data.workers)
+        current = self.state(owner)
+
+        loads = [0.0] * w
+        for i, k in enumerate(owner):
+            loads[k] += data.effort[i]
+
+        best: Optional[Tuple[int, int, JointState]] = None
+        best_value = current.objective - 1e-9
+        for i in range(len(data.tasks)):
+            old = owner[i]
+            h = data.effort[i]
+            for k in range(w):
+                if k == old:
+                    continue
+                loads[old] -= h
+                loads[k] += h
+                max_load = max(loads)
+                loads[old] += h
+                loads[k] -= h
+                total_pref = current.total_pref - data.pref[i * w + old] + data.pref[i * w + k]
+
+                owner[i] = k
+                durations, _ = self.evaluator.instance(owner)
+                bound = self.objective(max_load, total_pref, self.evaluator.lower_bound(durations))
+                if bound < best_value:
+                    makespan = self.evaluator.evaluate(owner).makespan
+                    value = self.objective(max_load, total_pref, makespan)
+                    if value < best_value:
+                        best_value = value
+                        best = (i, k, JointState(value, max_load, total_pref, makespan))
+                owner[i] = old
+        return best
+
+    def run(self, max_iter: int = 100, verbose: bool = True) -> Tuple[array, List[JointState]]:
+        owner = self.initial_assignment()
+        history = [self.state(owner)]
+        if verbose:
+            print(f"\n{'Итер.':<6} | {'Цель':<8} | {'maxLoad':<8} | {'Пред.':<6} | {'Makespan':<8} | {'Перенос':<28}")
+            print("-" * 78)
+            s = history[0]
+            print(f"{0:<6} | {s.objective:<8.4f} | {s.max_load:<8g} | {s.total_pref:<6g} | {s.makespan:<8} | {'начальное назначение':<28}")
+
+        for it in range(1, max_iter + 1):
+            move = self.improve(owner)
+            if move is None:
+                break
+            i, k, s = move
+            owner[i] = k
+            history.append(s)
+            if verbose:
+                desc = f"{self.packages.data.tasks[i]} -> {self.packages.data.workers[k]}"
+                print(f"{it:<6} | {s.objective:<8.4f} | {s.max_load:<8g} | {s.total_pref:<6g} | {s.makespan:<8} | {desc:<28}")
+        return owner, history
+
+
+# =============================================================================
+# ЗАПУСК
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Совместное распределение работ и планирование")
+    parser.add_argument("--prefs", default=None,
+                        help="Предпочтения исполнителей (data.txt / CSV / Parquet, строки - роли или пакеты 'j.ROLE')")
+    parser.add_argument("--alpha", type=float, default=0.3, help="Вес баланса нагрузки")
+    parser.add_argument("--beta", type=float, default=0.3, help="Вес предпочтений")
+    parser.add_argument("--gamma", type=float, default=0.4, help="Вес срока проекта (makespan)")
+    parser.add_argument("--random", type=int, default=50, help="Число случайных Activity List на оценку")
+    parser.add_argument("--max-iter", type=int, default=100, help="Максимальное число итераций")
+    parser.add_argument("--output", default=None, help="JSON-файл для сохранения совместного плана")
+    args = parser.parse_args()
+
+    prefs = load_assignment_data(args.prefs, cache_dir=DEFAULT_CACHE_DIR) if args.prefs else None
+    team = load_assignment_data(PHASE2_DATA, cache_dir=DEFAULT_CACHE_DIR).workers
+    packages = build_work_packages(LABOR_HOURS, team, prefs, TASK_NAMES)
+    evaluator = ScheduleEvaluator(packages, predecessors, num_random=args.random)
+    planner = JointPlanner(packages, evaluator, args.alpha, args.beta, args.gamma)
+
+    data = packages.data
+    print("=" * 70)
+    print("СОВМЕСТНОЕ РАСПРЕДЕЛЕНИЕ РАБОТ И ПЛАНИРОВАНИЕ")
+    print("=" * 70)
+    print(f"\nИсполнители: {', '.join(data.workers)}")
+    print(f"Пакетов работ: {len(data.tasks)}, общая трудоёмкость: {planner.total_effort:g} ч")
+    print(f"Границы makespan: {planner.Mmin} (роли параллельно) .. {planner.Mmax} (последовательно) дней")
+    print(f"Веса: alpha={args.alpha}, beta={args.beta}, gamma={args.gamma}")
+    if prefs is None:
+        print(f"ВНИМАНИЕ: предпочтения по ролям не заданы (--prefs), используется заглушка "
+              f"{PLACEHOLDER_PREF} для всех - критерий предпочтений не влияет на план")
+
+    owner, history = planner.run(max_iter=args.max_iter)
+    schedule = evaluator.evaluate(owner)
+    final = history[-1]
+
+    print(f"\nИтераций: {len(history) - 1}")
+    print(f"Кэш расписаний: {len(evaluator.cache)} записей, попаданий {evaluator.hits}, построений {evaluator.misses}")
+
+    print("\n" + "=" * 70)
+    print("СВОДКА ПО ИСПОЛНИТЕЛЯМ")
+    print("=" * 70)
+    stats = worker_statistics(owner, data)
+    for n in data.workers:
+        s = stats[n]
+        print(f"\n{n}: {s['count']} пакетов, {s['load']:g} ч, ср. предпочтение {s['avg_pref']:.2f}")
+        print(f"  {', '.join(s['tasks'])}")
+
+    print("\n" + "=" * 70)
+    print(f"РАСПИСАНИЕ (makespan = {schedule.makespan} дней, метод: {schedule.method})")
+    print("=" * 70)
+    print(f"\n{'№':<3} | {'Задача':<45} | {'Начало':<7} | {'Конец':<7} | Исполнители")
+    print("-" * 95)
+    n_act = len(schedule.durations)
+    for j in range(1, n_act - 1):
+        people = [data.workers[k] for k, d in enumerate(schedule.demands[j]) if d]
+        start = schedule.start_times[j]
+        print(f"{j:<3} | {TASK_NAMES[j][:45]:<45} | {start:<7} | {start + schedule.durations[j]:<7} | {', '.join(people)}")
+
+    print(f"\nИтог: цель = {final.objective:.4f}, maxLoad = {final.max_load:g} ч, "
+          f"суммарное предпочтение = {final.total_pref:g}, makespan = {final.makespan} дней")
+
+    if args.output:
+        plan = {
+            "workers": data.workers,
+            # Исходные идентификаторы (множество N в data.txt / колонки --prefs) в том же порядке
+            "worker_ids": prefs.workers if prefs is not None else team,
+            "assignments": {n: stats[n]["tasks"] for n in data.workers},
+            "worker_stats": stats,
+            "start_times": schedule.start_times,
+            "durations": schedule.durations,
+            "makespan": schedule.makespan,
+            "objective": final.objective,
+            "history": [s._asdict() for s in history],
+            "alpha": args.alpha,
+            "beta": args.beta,
+            "gamma": args.gamma,
+            "prefs": args.prefs or f"placeholder ({PLACEHOLDER_PREF} для всех)",
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(plan, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Совместный план сохранён в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Многопроектное планирование с общими ресурсами
+
+Несколько проектов (каждый со своими predecessors, длительностями, этапами
+и директивным сроком) объединяются в одну сеть:
+- фиктивная задача 0 - общий старт, предшественник стартовых задач проектов
+- последняя фиктивная задача - общий финиш, последователь финишных задач проектов
+- все проекты используют одни и те же ресурсы PM/BE/FE с общей доступностью
+
+Объединённая сеть расписывается теми же приоритетными правилами и
+ActivityListSampler, что и одиночный проект; декодирование выполняет
+ProfileActivityListDecoder (профиль ресурсов), рассчитанный на тысячи задач.
+Лучшее решение выбирается по суммарному опозданию, затем по общему makespan.
+
+Формат проекта - как в batch_scheduling.py (project_data.iter_paths), плюс необязательные поля:
+    "name": "...", "due_date": 30, "stages": {"1": [1, 2, 3], ...}
+"""
+
+import argparse
+import json
+import random
+import time
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from utility import ActivityListSampler, successors_by_predecessors
+from project_data import STAGES, LABOR_HOURS, predecessors as base_predecessors, instance_rcpsp_data, iter_paths
+from heuristics import compute_critical_metrics, make_heuristics
+from profile_decoder import ProfileActivityListDecoder
+
+
+class ProjectNetwork(NamedTuple):
+    """Объединённая сеть нескольких проектов"""
+    durations: List[int]
+    demands: List[List[int]]
+    predecessors: List[List[int]]
+    project_of: array           # project_of[j] - номер проекта задачи j (-1 для общих Start/Finish)
+    offsets: List[int]          # offsets[p] - номер первой задачи проекта p в объединённой сети
+    projects: List[dict]
+
+
+class ProjectReport(NamedTuple):
+    name: str
+    activities: int
+    start: int
+    finish: int
+    due_date: Optional[int]
+    delay: int
+    stages: Dict[str, Tuple[int, int]]
+
+
+def merge_projects(projects: List[dict]) -> ProjectNetwork:
+    """Объединение проектов в одну сеть с общими Start/Finish"""
+    durations: List[int] = [0]
+    demands: List[List[int]] = []
+    preds: List[List[int]] = [[]]
+    project_of = array("i", [-1])
+    offsets: List[int] = []
+    finish_nodes: List[int] = []
+    num_resources = None
+
+    for p, project in enumerate(projects):
+        p_durations, p_demands = instance_rcpsp_data(project)
+        p_preds = project["predecessors"]
+        if num_resources is None:
+            num_resources = len(p_demands[0])
+            demands.append([0] * num_resources)
+        if any(len(d) != num_resources for d in p_demands):
+            raise ValueError(f"Проект {project.get('name', p)}: число ресурсов отличается от остальных проектов")
+
+        offset = len(durations)
+        offsets.append(offset)
+        has_successors = [False] * len(p_durations)
+        for j, pj in enumerate(p_preds):
+            for i in pj:
+                has_successors[i] = True
+            # Стартовые задачи проекта зависят от общего Start
+            preds.append([offset + i for i in pj] if pj else [0])
+        durations.extend(p_durations)
+        demands.extend(list(d) for d in p_demands)
+        project_of.extend([p] * len(p_durations))
+        finish_nodes.extend(offset + j for j, s in enumerate(has_successors) if not s)
+
+    # Общий Finish
+    durations.append(0)
+    demands.append([0] * (num_resources or 0))
+    preds.append(finish_nodes)
+    project_of.append(-1)
+
+    return ProjectNetwork(durations, demands, preds, project_of, offsets, projects)
+
+
+def project_reports(network: ProjectNetwork, start_times: List[int]) -> List[ProjectReport]:
+    """Срок, опоздание и этапы каждого проекта в расписании - один проход по задачам"""
+    num_projects = len(network.projects)
+    first_start = [None] * num_projects
+    last_finish = [0] * num_projects
+    for j, p in enumerate(network.project_of):
+        if p < 0 or network.durations[j] == 0:
+            continue
+        s = start_times[j]
+        f = s + network.durations[j]
+        if first_start[p] is None or s < first_start[p]:
+            first_start[p] = s
+        if f > last_finish[p]:
+            last_finish[p] = f
+
+    reports = []
+    for p, project in enumerate(network.projects):
+        offset = network.offsets[p]
+        due = project.get("due_date")
+        stages = {}
+        for stage, tasks in (project.get("stages") or {}).items():
+            stages[str(stage)] = (
+                min(start_times[offset + i] for i in tasks),
+                max(start_times[offset + i] + network.durations[offset + i] for i in tasks),
+            )
+        reports.append(ProjectReport(
+            name=str(project.get("name", project.get("id", p + 1))),
+            activities=len(project["predecessors"]),
+            start=first_start[p] or 0,
+            finish=last_finish[p],
+            due_date=due,
+            delay=max(0, last_finish[p] - due) if due is not None else 0,
+            stages=stages,
+        ))
+    return reports
+
+
+class PortfolioSchedule(NamedTuple):
+    method: str
+    start_times: List[int]
+    makespan: int
+    total_delay: int
+    reports: List[ProjectReport]
+
+
+def schedule_portfolio(network: ProjectNetwork, capacities: List[int], num_random: int = 1000,
+                       time_budget: Optional[float] = None, verbose: bool = True) -> PortfolioSchedule:
+    """Приоритетные правила + случайная выборка на объединённой сети"""
+    durations, demands, preds = network.durations, network.demands, network.predecessors
+    successors = successors_by_predecessors(preds)
+    metrics = compute_critical_metrics(durations, preds, successors)
+    heuristics = make_heuristics(durations, successors, demands, capacities, metrics)
+    sampler = ActivityListSampler(preds, successors)
+    decoder = ProfileActivityListDecoder()
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+
+    best: Optional[PortfolioSchedule] = None
+
+    def evaluate(name: str, activity_list: List[int]) -> PortfolioSchedule:
+        nonlocal best
+        start_times = decoder.decode(activity_list, durations, preds, demands, capacities)
+        reports = project_reports(network, start_times)
+        candidate = PortfolioSchedule(
+            method=name,
+            start_times=start_times,
+            makespan=start_times[-1],
+            total_delay=sum(r.delay for r in reports),
+            reports=reports,
+        )
+        if best is None or (candidate.total_delay, candidate.makespan) < (best.total_delay, best.makespan):
+            best = candidate
+        return candidate
+
+    for name, rule, direction in heuristics:
+        if direction == "min":
+            result = evaluate(name, sampler.generate_by_min_rule(rule))
+        else:
+            result = evaluate(name, sampler.generate_by_max_rule(rule))
+        if verbose:
+            print(f"{name:8s}: makespan = {result.makespan:4d}, суммарное опоздание = {result.total_delay}")
+
+    for _ in range(num_random):
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        evaluate("RANDOM", sampler.generate_random())
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Многопроектное планирование с общими ресурсами")
+    parser.add_argument("paths", nargs="*",
+                        help="Файлы или каталоги с проектами *.json; без аргументов - копии проекта из отчёта")
+    parser.add_argument("--copies", type=int, default=3, help="Число копий проекта из отчёта (без paths)")
+    parser.add_argument("--capacities", type=int, nargs="+", default=None,
+                        help="Общая доступность ресурсов (по умолчанию - из первого проекта)")
+    parser.add_argument("--random", type=int, default=1000, help="Число случайных Activity List")
+    parser.add_argument("--time-budget", type=float, default=None, help="Ограничение времени на случайную выборку, секунды")
+    parser.add_argument("--seed", type=int, default=42, help="Seed генератора случайных чисел")
+    parser.add_argument("--output", default=None, help="JSON-файл для сохранения результатов")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    if args.paths:
+        projects = []
+        for default_id, project, error in iter_paths(args.paths):
+            if error is not None:
+                parser.error(f"Проект {default_id}: {error}")
+            project.setdefault("name", default_id)
+            projects.append(project)
+    else:
+        projects = [
+            {"name": f"Проект {p + 1}", "predecessors": base_predecessors, "labor_hours": LABOR_HOURS,
+             "renewable_capacities": [1, 1, 1], "stages": STAGES}
+            for p in range(args.copies)
+        ]
+
+    capacities = args.capacities or projects[0].get("renewable_capacities")
+    if not capacities:
+        parser.error("Не задана доступность ресурсов (--capacities или renewable_capacities в проекте)")
+
+    network = merge_projects(projects)
+    if len(capacities) != len(network.demands[0]):
+        parser.error(f"--capacities: ожидается {len(network.demands[0])} значений")
+
+    print("=" * 70)
+    print("МНОГОПРОЕКТНОЕ ПЛАНИРОВАНИЕ")
+    print("=" * 70)
+    print(f"\nПроектов: {len(projects)}, задач в объединённой сети: {len(network.durations)}")
+    print(f"Общая доступность ресурсов: {capacities}\n")
+
+    started = time.perf_counter()
+    best = schedule_portfolio(network, capacities, args.random, args.time_budget)
+    elapsed = time.perf_counter() - started
+
+    print(f"\nЛучшее решение: {best.method}, makespan = {best.makespan} дней, "
+          f"суммарное опоздание = {best.total_delay} дней ({elapsed:.2f} с)")
+
+    print(f"\n{'Проект':<20} | {'Задач':<6} | {'Начало':<7} | {'Конец':<7} | {'Срок':<6} | {'Опоздание':<9}")
+    print("-" * 70)
+    for r in best.reports:
+        due = r.due_date if r.due_date is not None else "—"
+        print(f"{r.name[:20]:<20} | {r.activities:<6} | {r.start:<7} | {r.finish:<7} | {due:<6} | {r.delay:<9}")
+
+    for r in best.reports:
+        if r.stages:
+            print(f"\n{r.name}, сроки по этапам:")
+            for stage, (s, f) in r.stages.items():
+                print(f"  Этап {stage}: дни {s:3d} - {f:3d} (длительность: {f - s} дн.)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "method": best.method,
+                "makespan": best.makespan,
+                "total_delay": best.total_delay,
+                "capacities": capacities,
+                "projects": [r._asdict() for r in best.reports],
+                "start_times": best.start_times,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Результаты сохранены в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Декодер Activity List на профиле ресурсов (последовательная схема SGS)
+
+Интерфейс совпадает с utility.ActivityListDecoder:
+    decode(activity_list, durations, predecessors, demands, capacities) -> start_times
+
+Профиль хранится кусочно-постоянным: отсортированные точки излома times
+(моменты начала и окончания размещённых задач) и свободная мощность
+ресурсов на каждом отрезке [times[s], times[s + 1]); последний отрезок
+бесконечен. Поиск старта идёт по отрезкам, а не по периодам: отрезок,
+где какому-либо нужному ресурсу не хватает мощности, пропускается целиком,
+и следующий кандидат - момент его окончания (ближайшее освобождение ресурса).
+"""
+
+from bisect import bisect_right
+from typing import List
+
+
+class ProfileActivityListDecoder:
+    """Последовательная схема генерации расписания с профилем ресурсов"""
+
+    def decode(self, activity_list: List[int], durations: List[int], predecessors: List[List[int]],
+               demands: List[List[int]], capacities: List[int]) -> List[int]:
+        n = len(durations)
+        times = [0]
+        seg_free = [list(capacities)]
+        start_times = [0] * n
+        finish_times = [0] * n
+
+        for j in activity_list:
+            d = durations[j]
+            t = max((finish_times[i] for i in predecessors[j]), default=0)
+
+            if d > 0:
+                need = []
+                for k, q in enumerate(demands[j]):
+                    if q > capacities[k]:
+                        raise ValueError(f"Задача {j}: потребность {q} превышает доступность ресурса {k} ({capacities[k]})")
+                    if q > 0:
+                        need.append((k, q))
+
+                if need:
+                    t = self._earliest(times, seg_free, need, t, d)
+                    self._reserve(times, seg_free, need, t, d)
+
+            start_times[j] = t
+            finish_times[j] = t + d
+
+        return start_times
+
+    @staticmethod
+    def _earliest(times: List[int], seg_free: List[List[int]], need, t: int, d: int) -> int:
+        """Наименьший старт >= t, при котором мощности хватает на всём окне [start, start + d)"""
+        s = bisect_right(times, t) - 1
+        run_start = t
+        last = len(times) - 1
+        while True:
+            free = seg_free[s]
+            if any(free[k] < q for k, q in need):
+                # Отрезок недопустим - старт не раньше его окончания
+                s += 1
+                run_start = times[s]
+            elif s == last or times[s + 1] - run_start >= d:
+                return run_start
+            else:
+                s += 1
+
+    @staticmethod
+    def _split(times: List[int], seg_free: List[List[int]], t: int) -> int:
+        """Точка излома в момент t; возвращает номер отрезка, начинающегося в t"""
+        s = bisect_right(times, t) - 1
+        if times[s] == t:
+            return s
+        times.insert(s + 1, t)
+        seg_free.insert(s + 1, list(seg_free[s]))
+        return s + 1
+
+    @classmethod
+    def _reserve(cls, times: List[int], seg_free: List[List[int]], need, t: int, d: int) -> None:
+        """Списание мощности на окне [t, t + d)"""
+        first = cls._split(times, seg_free, t)
+        end = cls._split(times, seg_free, t + d)
+        for s in range(first, end):
+            free = seg_free[s]
+            for k, q in need:
+                free[k] -= q
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Входные данные задачи планирования (Фаза 5)
+Проект: Мобильная игра "Цифровой кузнечик"
+
+Названия задач, этапы, трудозатраты по ролям [PM, BE, FE] и зависимости
+предшествования из отчёта, а также их преобразование в данные RCPSP
+и чтение экземпляров задачи из JSON-файлов.
+"""
+
+import glob
+import json
+import os
+from typing import Iterator, List, Optional, Tuple
+
+# Экземпляр из источника: (id по умолчанию, экземпляр, ошибка чтения)
+SourceItem = Tuple[str, Optional[dict], Optional[str]]
+
+# =============================================================================
+# ВХОДНЫЕ ДАННЫЕ ИЗ ОТЧЁТА
+# =============================================================================
+
+# Названия задач (индекс 0 - Start, индекс 23 - Finish - фиктивные)
+TASK_NAMES = [
+    "0. Start (фиктивная)",                          # 0
+    "1. Анализ требований и юз-кейсов",              # 1
+    "2. Проектирование архитектуры приложения",      # 2
+    "3. Проектирование структуры БД (SQLite)",       # 3
+    "4. Проектирование экранов",                     # 4
+    "5. Настройка окружения для ведения разработки", # 5
+    "6. Реализация логики игрового поля",            # 6
+    "7. Реализация правил игры",                     # 7
+    "8. Реализация логики игровых уровней",          # 8
+    "9. CRUD уровней",                               # 9
+    "10. Реализация логики сбора и агрегации статистики", # 10
+    "11. CRUD статистики",                           # 11
+    "12. Создание встроенных уровней",               # 12
+    "13. Реализация алгоритма генерации уровней",    # 13
+    "14. Реализация экрана правил игры",             # 14
+    "15. Реализация экрана просмотра статистики",    # 15
+    "16. Реализация экрана главного меню",           # 16
+    "17. Реализация экрана настроек",                # 17
+    "18. Реализация экрана выбора уровней",          # 18
+    "19. Реализация экрана генерации уровня",        # 19
+    "20. Реализация экрана игры",                    # 20
+    "21. Тестирование игры",                         # 21
+    "22. Публикация игры в стор",                    # 22
+    "23. Finish (фиктивная)",                        # 23
+]
+
+# Принадлежность к этапам
+STAGES = {
+    1: [1, 2, 3, 4, 5],      # Этап 1: Инициация и проектирование
+    2: [6, 7, 8, 9, 10, 11, 12, 13],  # Этап 2: Бэк часть
+    3: [14, 15, 16, 17, 18, 19, 20],   # Этап 3: Фронт часть
+    4: [21, 22],            # Этап 4: Финальная часть
+}
+
+# Роли команды (порядок совпадает с колонками LABOR_HOURS)
+ROLES = ["PM", "BE", "FE"]
+
+# Трудозатраты (человеко-часы) из отчёта: [PM, BE, FE]
+# Индекс 0 и 23 - фиктивные задачи (Start, Finish)
+LABOR_HOURS = [
+    [0, 0, 0],      # 0 - Start
+    [16, 6, 6],     # 1 - Анализ требований
+    [10, 6, 2],     # 2 - Проектирование архитектуры
+    [8, 6, 0],      # 3 - Проектирование БД
+    [4, 0, 8],      # 4 - Проектирование экранов
+    [1, 8, 6],      # 5 - Настройка окружения
+    [1, 8, 1],      # 6 - Логика игрового поля
+    [1, 8, 0],      # 7 - Правила игры
+    [1, 8, 1],      # 8 - Логика игровых уровней
+    [0, 4, 0],      # 9 - CRUD уровней
+    [1, 10, 0],     # 10 - Логика статистики
+    [0, 4, 0],      # 11 - CRUD статистики
+    [4, 4, 0],      # 12 - Создание встроенных уровней
+    [4, 8, 0],      # 13 - Алгоритм генерации уровней
+    [1, 0, 3],      # 14 - Экран правил
+    [2, 1, 6],      # 15 - Экран статистики
+    [1, 0, 6],      # 16 - Экран меню
+    [0, 1, 6],      # 17 - Экран настроек
+    [0, 1, 6],      # 18 - Экран выбора уровней
+    [0, 2, 6],      # 19 - Экран генерации уровня
+    [1, 2, 6],      # 20 - Экран игры
+    [8, 8, 8],      # 21 - Тестирование
+    [8, 4, 1],      # 22 - Публикация
+    [0, 0, 0],      # 23 - Finish
+]
+
+# =============================================================================
+# ФОРМИРОВАНИЕ ЗАВИСИМОСТЕЙ ПРЕДШЕСТВОВАНИЯ
+# =============================================================================
+# Логика:
+# - Start (0) -> все задачи этапа 1
+# - Задачи этапа 1 -> Настройка окружения (5) -> Задачи этапов 2 и 3 (частично)
+# - Проектирование архитектуры (2) и БД (3) -> Backend задачи
+# - Проектирование экранов (4) -> Frontend задачи
+# - Backend и Frontend задачи -> Тестирование (21)
+# - Тестирование (21) -> Публикация (22) -> Finish (23)
+
+predecessors = [
+    [],              # 0 - Start (нет предшественников)
+    [0],             # 1 - Анализ требований <- Start
+    [1],             # 2 - Проект. архитектуры <- Анализ
+    [1],             # 3 - Проект. БД <- Анализ
+    [1],             # 4 - Проект. экранов <- Анализ
+    [2, 3, 4],       # 5 - Настройка окружения <- Все проектирования
+    [5, 2, 3],       # 6 - Логика поля <- Окружение, Архитектура, БД
+    [6],             # 7 - Правила игры <- Логика поля
+    [6],             # 8 - Логика уровней <- Логика поля
+    [8],             # 9 - CRUD уровней <- Логика уровней
+    [6],             # 10 - Логика статистики <- Логика поля
+    [10],            # 11 - CRUD статистики <- Логика статистики
+    [8, 9],          # 12 - Встроенные уровни <- Логика уровней, CRUD
+    [8],             # 13 - Алгоритм генерации <- Логика уровней
+    [5, 4],          # 14 - Экран правил <- Окружение, Проект. экранов
+    [11, 5, 4],      # 15 - Экран статистики <- CRUD статистики, Окружение
+    [5, 4],          # 16 - Экран меню <- Окружение, Проект. экранов
+    [5, 4],          # 17 - Экран настроек <- Окружение, Проект. экранов
+    [9, 5, 4],       # 18 - Экран выбора уровней <- CRUD уровней
+    [13, 5, 4],      # 19 - Экран генерации <- Алгоритм генерации
+    [7, 5, 4],       # 20 - Экран игры <- Правила игры
+    [7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20], # 21 - Тестирование <- Все реализации
+    [21],            # 22 - Публикация <- Тестирование
+    [22],            # 23 - Finish <- Публикация
+]
+
+# =============================================================================
+# ПРЕОБРАЗОВАНИЕ ТРУДОЗАТРАТ В ДЛИТЕЛЬНОСТИ И ПОТРЕБНОСТИ
+# =============================================================================
+
+def convert_to_rcpsp_data(labor_hours: List[List[int]], hours_per_day: int = 8):
+    """
+    Преобразование трудозатрат в длительности и ресурсные потребности.
+    
+    Допущения:
+    - Ресурсы работают параллельно над одной задачей
+    - Длительность = max(часов по ролям) / часов_в_день
+    - Потребность = 1, если роль задействована
+    """
+    durations = []
+    demands = []
+    
+    for hours in labor_hours:
+        pm, be, fe = hours
+        max_hours = max(pm, be, fe)
+        
+        # Длительность в днях (округляем вверх для ненулевых)
+        if max_hours == 0:
+            dur = 0
+        else:
+            dur = max(1, (max_hours + hours_per_day - 1) // hours_per_day)
+        
+        # Потребности: 1 если роль задействована, 0 иначе
+        demand = [1 if pm > 0 else 0, 1 if be > 0 else 0, 1 if fe > 0 else 0]
+        
+        durations.append(dur)
+        demands.append(demand)
+    
+    return durations, demands
+
+
+# =============================================================================
+# ЭКЗЕМПЛЯРЫ ЗАДАЧИ ИЗ ФАЙЛОВ
+# =============================================================================
+
+def instance_rcpsp_data(instance: dict) -> Tuple[List[int], List[List[int]]]:
+    """Длительности и потребности экземпляра (напрямую или из labor_hours)"""
+    if "labor_hours" in instance:
+        return convert_to_rcpsp_data(instance["labor_hours"], instance.get("hours_per_day", 8))
+    return instance["durations"], instance["renewable_demands"]
+
+
+def instance_error(instance) -> Optional[str]:
+    """Описание ошибки, если прочитанный JSON не является экземпляром (объектом)"""
+    if not isinstance(instance, dict):
+        return f"ожидается JSON-объект, получено {type(instance).__name__}"
+    return None
+
+
+def iter_paths(paths) -> Iterator[SourceItem]:
+    """Экземпляры из файлов и каталогов (*.json); ошибка чтения файла - в третьем элементе"""
+    for path in paths:
+        files = sorted(glob.glob(os.path.join(path, "*.json"))) if os.path.isdir(path) else [path]
+        for file in files:
+            default_id = os.path.splitext(os.path.basename(file))[0]
+            try:
+                with open(file, encoding="utf-8") as f:
+                    instance = json.load(f)
+            except (OSError, ValueError) as e:
+                yield default_id, None, f"{type(e).__name__}: {e}"
+                continue
+            yield default_id, instance, instance_error(instance)
@@ -13,153 +13,14 @@
 """
 
 import random
-from typing import List, Tuple, Callable
-from utility import calculate_critical_times, ActivityListSampler, ActivityListDecoder, successors_by_predecessors
+from typing import List, Tuple
+from utility import ActivityListSampler, ActivityListDecoder, successors_by_predecessors
+from project_data import TASK_NAMES, STAGES, LABOR_HOURS, predecessors, convert_to_rcpsp_data
+from heuristics import compute_critical_metrics, make_heuristics
 
 # Фиксируем seed для воспроизводимости
 random.seed(42)
 
-# =============================================================================
-# ВХОДНЫЕ ДАННЫЕ ИЗ ОТЧЁТА
-# =============================================================================
-
-# Названия задач (индекс 0 - Start, индекс 23 - Finish - фиктивные)
-TASK_NAMES = [
-    "0. Start (фиктивная)",                          # 0
-    "1. Анализ требований и юз-кейсов",              # 1
-    "2. Проектирование архитектуры приложения",      # 2
-    "3. Проектирование структуры БД (SQLite)",       # 3
-    "4. Проектирование экранов",                     # 4
-    "5. Настройка окружения для ведения разработки", # 5
-    "6. Реализация логики игрового поля",            # 6
-    "7. Реализация правил игры",                     # 7
-    "8. Реализация логики игровых уровней",          # 8
-    "9. CRUD уровней",                               # 9
-    "10. Реализация логики сбора и агрегации статистики", # 10
-    "11. CRUD статистики",                           # 11
-    "12. Создание встроенных уровней",               # 12
-    "13. Реализация алгоритма генерации уровней",    # 13
-    "14. Реализация экрана правил игры",             # 14
-    "15. Реализация экрана просмотра статистики",    # 15
-    "16. Реализация экрана главного меню",           # 16
-    "17. Реализация экрана настроек",                # 17
-    "18. Реализация экрана выбора уровней",          # 18
-    "19. Реализация экрана генерации уровня",        # 19
-    "20. Реализация экрана игры",                    # 20
-    "21. Тестирование игры",                         # 21
-    "22. Публикация игры в стор",                    # 22
-    "23. Finish (фиктивная)",                        # 23
-]
-
-# Принадлежность к этапам
-STAGES = {
-    1: [1, 2, 3, 4, 5],      # Этап 1: Инициация и проектирование
-    2: [6, 7, 8, 9, 10, 11, 12, 13],  # Этап 2: Бэк часть
-    3: [14, 15, 16, 17, 18, 19, 20],   # Этап 3: Фронт часть
-    4: [21, 22],            # Этап 4: Финальная часть
-}
-
-# Трудозатраты (человеко-часы) из отчёта: [PM, BE, FE]
-# Индекс 0 и 23 - фиктивные задачи (Start, Finish)
-LABOR_HOURS = [
-    [0, 0, 0],      # 0 - Start
-    [16, 6, 6],     # 1 - Анализ требований
-    [10, 6, 2],     # 2 - Проектирование архитектуры
-    [8, 6, 0],      # 3 - Проектирование БД
-    [4, 0, 8],      # 4 - Проектирование экранов
-    [1, 8, 6],      # 5 - Настройка окружения
-    [1, 8, 1],      # 6 - Логика игрового поля
-    [1, 8, 0],      # 7 - Правила игры
-    [1, 8, 1],      # 8 - Логика игровых уровней
-    [0, 4, 0],      # 9 - CRUD уровней
-    [1, 10, 0],     # 10 - Логика статистики
-    [0, 4, 0],      # 11 - CRUD статистики
-    [4, 4, 0],      # 12 - Создание встроенных уровней
-    [4, 8, 0],      # 13 - Алгоритм генерации уровней
-    [1, 0, 3],      # 14 - Экран правил
-    [2, 1, 6],      # 15 - Экран статистики
-    [1, 0, 6],      # 16 - Экран меню
-    [0, 1, 6],      # 17 - Экран настроек
-    [0, 1, 6],      # 18 - Экран выбора уровней
-    [0, 2, 6],      # 19 - Экран генерации уровня
-    [1, 2, 6],      # 20 - Экран игры
-    [8, 8, 8],      # 21 - Тестирование
-    [8, 4, 1],      # 22 - Публикация
-    [0, 0, 0],      # 23 - Finish
-]
-
-# =============================================================================
-# ФОРМИРОВАНИЕ ЗАВИСИМОСТЕЙ ПРЕДШЕСТВОВАНИЯ
-# =============================================================================
-# Логика:
-# - Start (0) -> все задачи этапа 1
-# - Задачи этапа 1 -> Настройка окружения (5) -> Задачи этапов 2 и 3 (частично)
-# - Проектирование архитектуры (2) и БД (3) -> Backend задачи
-# - Проектирование экранов (4) -> Frontend задачи
-# - Backend и Frontend задачи -> Тестирование (21)
-# - Тестирование (21) -> Публикация (22) -> Finish (23)
-
-predecessors = [
-    [],              # 0 - Start (нет предшественников)
-    [0],             # 1 - Анализ требований <- Start
-    [1],             # 2 - Проект. архитектуры <- Анализ
-    [1],             # 3 - Проект. БД <- Анализ
-    [1],             # 4 - Проект. экранов <- Анализ
-    [2, 3, 4],       # 5 - Настройка окружения <- Все проектирования
-    [5, 2, 3],       # 6 - Логика поля <- Окружение, Архитектура, БД
-    [6],             # 7 - Правила игры <- Логика поля
-    [6],             # 8 - Логика уровней <- Логика поля
-    [8],             # 9 - CRUD уровней <- Логика уровней
-    [6],             # 10 - Логика статистики <- Логика поля
-    [10],            # 11 - CRUD статистики <- Логика статистики
-    [8, 9],          # 12 - Встроенные уровни <- Логика уровней, CRUD
-    [8],             # 13 - Алгоритм генерации <- Логика уровней
-    [5, 4],          # 14 - Экран правил <- Окружение, Проект. экранов
-    [11, 5, 4],      # 15 - Экран статистики <- CRUD статистики, Окружение
-    [5, 4],          # 16 - Экран меню <- Окружение, Проект. экранов
-    [5, 4],          # 17 - Экран настроек <- Окружение, Проект. экранов
-    [9, 5, 4],       # 18 - Экран выбора уровней <- CRUD уровней
-    [13, 5, 4],      # 19 - Экран генерации <- Алгоритм генерации
-    [7, 5, 4],       # 20 - Экран игры <- Правила игры
-    [7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20], # 21 - Тестирование <- Все реализации
-    [21],            # 22 - Публикация <- Тестирование
-    [22],            # 23 - Finish <- Публикация
-]
-
-# =============================================================================
-# ПРЕОБРАЗОВАНИЕ ТРУДОЗАТРАТ В ДЛИТЕЛЬНОСТИ И ПОТРЕБНОСТИ
-# =============================================================================
-
-def convert_to_rcpsp_data(labor_hours: List[List[int]], hours_per_day: int = 8):
-    """
-    Преобразование трудозатрат в длительности и ресурсные потребности.
-    
-    Допущения:
-    - Ресурсы работают параллельно над одной задачей
-    - Длительность = max(часов по ролям) / часов_в_день
-    - Потребность = 1, если роль задействована
-    """
-    durations = []
-    demands = []
-    
-    for hours in labor_hours:
-        pm, be, fe = hours
-        max_hours = max(pm, be, fe)
-        
-        # Длительность в днях (округляем вверх для ненулевых)
-        if max_hours == 0:
-            dur = 0
-        else:
-            dur = max(1, (max_hours + hours_per_day - 1) // hours_per_day)
-        
-        # Потребности: 1 если роль задействована, 0 иначе
-        demand = [1 if pm > 0 else 0, 1 if be > 0 else 0, 1 if fe > 0 else 0]
-        
-        durations.append(dur)
-        demands.append(demand)
-    
-    return durations, demands
-
 # Доступность ресурсов: 1 PM, 1 BE, 1 FE
 renewable_capacities = [1, 1, 1]
 
@@ -181,39 +42,12 @@ for i, (name, dur, demand) in enumerate(zip(TASK_NAMES, durations, renewable_dem
 # =============================================================================
 
 successors = successors_by_predecessors(predecessors)
-earliest_start, latest_finish = calculate_critical_times(durations, predecessors, successors)
-
-# Вычисление дополнительных метрик
-n = len(durations)
-
-# Поздние времена начала
-latest_start = [latest_finish[i] - durations[i] + (durations[i] if durations[i] > 0 else 0) for i in range(n)]
-# Корректировка: LSTi = LFTi - di, но для нашей логики LSTi = min(LSTj - dj для j в successors[i])
-latest_start = [0] * n
-for i in range(n-1, -1, -1):
-    if i == n-1:
-        latest_start[i] = earliest_start[i]
-    elif successors[i]:
-        latest_start[i] = min(latest_start[j] for j in successors[i]) - durations[i]
-    else:
-        latest_start[i] = earliest_start[i]
-
-# Общий резерв (Total Slack)
-total_slack = [latest_start[i] - earliest_start[i] for i in range(n)]
-
-# Ранние времена окончания
-earliest_finish = [earliest_start[i] + durations[i] for i in range(n)]
-
-# Свободный резерв (Free Slack)
-free_slack = [0] * n
-for i in range(n):
-    if successors[i]:
-        free_slack[i] = min(earliest_start[j] for j in successors[i]) - earliest_finish[i]
-    else:
-        free_slack[i] = 0
-
-# Суммарные затраты ресурсов
-total_demands = [sum(renewable_demands[i]) for i in range(n)]
+metrics = compute_critical_metrics(durations, predecessors, successors)
+earliest_start = metrics.earliest_start
+latest_finish = metrics.latest_finish
+latest_start = metrics.latest_start
+total_slack = metrics.total_slack
+free_slack = metrics.free_slack
 
 print("\n" + "=" * 70)
 print("КРИТИЧЕСКИЕ ВРЕМЕНА")
@@ -228,83 +62,8 @@ print(f"Free Slack (FREE):   {free_slack}")
 # ОПРЕДЕЛЕНИЕ ЭВРИСТИК
 # =============================================================================
 
-def make_slk_rule():
-    """SLK - по возрастанию общего резерва"""
-    return lambda j: total_slack[j]
-
-def make_free_rule():
-    """FREE - по возрастанию свободного резерва"""
-    return lambda j: free_slack[j]
-
-def make_lst_rule():
-    """LST - по возрастанию позднего времени начала"""
-    return lambda j: latest_start[j]
-
-def make_lft_rule():
-    """LFT - по возрастанию позднего времени завершения"""
-    return lambda j: latest_finish[j]
-
-def make_lstlft_rule():
-    """LSTLFT - по возрастанию суммы LS + LF"""
-    return lambda j: latest_start[j] + latest_finish[j]
-
-def make_grpw_rule():
-    """GRPW - по убыванию суммарной длительности задачи и её прямых последователей"""
-    def rule(j):
-        succ_duration = sum(durations[s] for s in successors[j])
-        return durations[j] + succ_duration
-    return rule
-
-def make_lpt_rule():
-    """LPT - по убыванию длительности"""
-    return lambda j: durations[j]
-
-def make_mis_rule():
-    """MIS - по убыванию числа прямых последователей"""
-    return lambda j: len(successors[j])
-
-def make_grd_rule():
-    """GRD - по убыванию произведения длительности и суммарных затрат ресурсов"""
-    return lambda j: durations[j] * total_demands[j]
-
-def make_grwc_rule():
-    """GRWC - по убыванию суммарных затрат ресурсов"""
-    return lambda j: total_demands[j]
-
-def make_gcrwc_rule():
-    """GCRWC - по убыванию суммарных затрат ресурсов задачи и её прямых последователей"""
-    def rule(j):
-        succ_demands = sum(total_demands[s] for s in successors[j])
-        return total_demands[j] + succ_demands
-    return rule
-
-def make_rot_rule():
-    """ROT - по убыванию суммы отношений затрат ресурсов к запасам, делённой на длительность"""
-    def rule(j):
-        if durations[j] == 0:
-            return 0
-        ratio_sum = sum(
-            renewable_demands[j][k] / renewable_capacities[k] if renewable_capacities[k] > 0 else 0
-            for k in range(len(renewable_capacities))
-        )
-        return ratio_sum / durations[j]
-    return rule
-
-# Список эвристик с названиями и направлениями
-HEURISTICS = [
-    ("SLK", make_slk_rule(), "min"),
-    ("FREE", make_free_rule(), "min"),
-    ("LST", make_lst_rule(), "min"),
-    ("LFT", make_lft_rule(), "min"),
-    ("LSTLFT", make_lstlft_rule(), "min"),
-    ("GRPW", make_grpw_rule(), "max"),
-    ("LPT", make_lpt_rule(), "max"),
-    ("MIS", make_mis_rule(), "max"),
-    ("GRD", make_grd_rule(), "max"),
-    ("GRWC", make_grwc_rule(), "max"),
-    ("GCRWC", make_gcrwc_rule(), "max"),
-    ("ROT", make_rot_rule(), "max"),
-]
+# SLK, FREE, LST, LFT, LSTLFT - по возрастанию; GRPW, LPT, MIS, GRD, GRWC, GCRWC, ROT - по убыванию
+HEURISTICS = make_heuristics(durations, successors, renewable_demands, renewable_capacities, metrics)
 
 # =============================================================================
 # ГЕНЕРАЦИЯ И ОЦЕНКА РЕШЕНИЙ